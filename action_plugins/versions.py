@@ -7,188 +7,435 @@ The resolved versions are returned as:
   - aipscan_version
   - aipscan_uv_version
   - aipscan_python_version
+
+Fetched responses are cached under $XDG_CACHE_HOME/ansible-aipscan (or
+~/.cache/ansible-aipscan) for cache_ttl seconds (an hour by default) and
+revalidated afterwards. Set cache_ttl to 0 to always query upstream.
+
+If GITHUB_TOKEN is set in the controller environment, it is sent to
+api.github.com as a bearer token to lift the unauthenticated rate limit.
 """
 
+import base64
+import functools
+import hashlib
 import json
+import os
+import random
 import re
 import time
 import urllib.error
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 from ansible.plugins.action import ActionBase
 
 
-PYPI_AIPSCAN_METADATA_URL = "https://pypi.org/pypi/aipscan/json"
-UV_LATEST_RELEASE_URL = "https://github.com/astral-sh/uv/releases/latest"
+PYPI_AIPSCAN_INDEX_URL = "https://pypi.org/simple/aipscan/"
+PYPI_SIMPLE_JSON_HEADERS = {"Accept": "application/vnd.pypi.simple.v1+json"}
+UV_LATEST_RELEASE_URL = "https://api.github.com/repos/astral-sh/uv/releases/latest"
+UV_LATEST_RELEASE_PAGE_URL = "https://github.com/astral-sh/uv/releases/latest"
+GITHUB_API_HEADERS = {"Accept": "application/vnd.github+json"}
+# Statuses the unauthenticated GitHub API answers with once its hourly quota
+# is used up.
+GITHUB_RATE_LIMIT_STATUSES = frozenset({403, 429})
 PYTHON_VERSION_TEMPLATE = "https://raw.githubusercontent.com/artefactual-labs/AIPscan/refs/tags/{tag}/.python-version"
 DEFAULT_TIMEOUT = 15
 DEFAULT_HEADERS = {"User-Agent": "ansible-aipscan/1.0"}
 HTTP_RETRIES = 3
 HTTP_RETRY_BACKOFF = 0.5
+HTTP_RETRY_MAX_BACKOFF = 5.0
+# Timeouts, rate limiting and transient gateway/server failures. Other 5xx
+# codes such as 501 are not going to succeed on a retry.
+HTTP_RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+CACHE_TTL = 3600
+
+_UV_TAG_RE = re.compile(r"^v?([^/?#]+)$")
+_UV_RELEASE_PAGE_TAG_RE = re.compile(r"/tag/([^/?#]+)")
+_FINAL_RELEASE_RE = re.compile(r"(?P<release>\d+(?:\.\d+)*)(?:\.post(?P<post>\d+))?")
+_DIST_FILENAME_RE = re.compile(
+    r"aipscan-(?P<version>[^-]+?)(?:-[^/]*\.whl|\.tar\.gz|\.zip)", re.IGNORECASE
+)
 
 
 class ResolutionError(Exception):
     """Raised when a component version cannot be determined."""
 
 
-class NoRedirectHandler(urllib.request.HTTPRedirectHandler):
-    def redirect_request(self, req, fp, code, msg, headers, newurl):  # type: ignore[override]
-        return None
+@functools.lru_cache(maxsize=None)
+def _shared_opener():
+    """Build the urllib opener shared by every HttpClient on first use.
+
+    urllib.request drags in http.client and ssl, which Ansible itself does not
+    need to load just to register this plugin, so it is imported lazily. The
+    opener carries a single SSL context so the system CA bundle is loaded once
+    rather than for every HTTPS connection.
+    """
+    import ssl
+    import urllib.request
+
+    class _PassThroughHandler(urllib.request.BaseHandler):
+        """Hand 304s, and redirects of HEAD requests, back to the caller.
+
+        Runs ahead of HTTPRedirectHandler so GET requests still follow
+        redirects as usual.
+        """
+
+        handler_order = 400
+
+        def http_error_304(self, req, fp, code, msg, headers):
+            return fp
+
+        def http_error_302(self, req, fp, code, msg, headers):
+            if req.get_method() == "HEAD":
+                return fp
+            return None
+
+        http_error_301 = http_error_303 = http_error_302
+        http_error_307 = http_error_308 = http_error_302
+
+    return urllib.request.build_opener(
+        urllib.request.HTTPSHandler(context=ssl.create_default_context()),
+        _PassThroughHandler,
+    )
+
+
+class _DiskCache:
+    """Store fetched response bodies on disk, keyed by URL, with a TTL."""
+
+    def __init__(self, directory=None, ttl=CACHE_TTL):
+        self.directory = directory or os.path.join(
+            os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+            "ansible-aipscan",
+        )
+        self.ttl = ttl
+
+    def get(self, url):
+        try:
+            with open(self._path(url), encoding="utf-8") as handle:
+                entry = json.load(handle)
+            entry["body"] = base64.b64decode(entry["body"])
+            float(entry["fetched_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return entry
+
+    def is_fresh(self, entry):
+        return time.time() - float(entry["fetched_at"]) < self.ttl
+
+    def put(self, url, body, etag=None, last_modified=None):
+        entry = {
+            "fetched_at": time.time(),
+            "body": base64.b64encode(body).decode("ascii"),
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        path = self._path(url)
+        # The cache is only an optimisation, so an unwritable directory must
+        # never fail the lookup itself.
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            partial = f"{path}.{os.getpid()}.tmp"
+            with open(partial, "w", encoding="utf-8") as handle:
+                json.dump(entry, handle)
+            os.replace(partial, path)
+        except OSError:
+            pass
+
+    def _path(self, url):
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
 
 
 class HttpClient:
     """Tiny HTTP helper that wraps urllib with retry and header defaults."""
 
-    def __init__(self, retries=HTTP_RETRIES, backoff=HTTP_RETRY_BACKOFF):
+    def __init__(self, retries=HTTP_RETRIES, backoff=HTTP_RETRY_BACKOFF, cache=None):
         self.retries = max(1, int(retries))
         self.backoff = max(0.0, float(backoff))
+        self.cache = cache
+        self._opener = _shared_opener()
 
-    def fetch_bytes(self, url, timeout, method="GET", headers=None, opener=None):
-        def call():
-            request = urllib.request.Request(
-                url, method=method, headers=self._merge_headers(headers)
-            )
-            if opener:
-                return opener.open(request, timeout=timeout)
-            return urllib.request.urlopen(request, timeout=timeout)
-
-        response = self._request_with_retry(call)
+    def fetch_bytes(
+        self,
+        url,
+        timeout,
+        method="GET",
+        headers=None,
+        retryable_statuses=HTTP_RETRYABLE_STATUSES,
+    ):
+        cache = self.cache if method == "GET" else None
+        entry = cache.get(url) if cache else None
+        if entry:
+            if cache.is_fresh(entry):
+                return entry["body"]
+            headers = self._conditional_headers(headers, entry)
+
+        response = self._request_with_retry(
+            lambda: self._open(url, timeout, method, headers), retryable_statuses
+        )
         try:
-            return response.read()
+            if entry and response.status == 304:
+                # Restart the TTL so following runs skip the network again, and
+                # pick up any validators the server rotated on revalidation.
+                cache.put(
+                    url,
+                    entry["body"],
+                    etag=response.headers.get("ETag") or entry.get("etag"),
+                    last_modified=response.headers.get("Last-Modified")
+                    or entry.get("last_modified"),
+                )
+                return entry["body"]
+            body = response.read()
         finally:
             response.close()
 
-    def head(self, url, timeout, headers=None, opener=None):
-        def call():
-            request = urllib.request.Request(
-                url, method="HEAD", headers=self._merge_headers(headers)
+        if cache:
+            cache.put(
+                url,
+                body,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
             )
-            if opener:
-                return opener.open(request, timeout=timeout)
-            return urllib.request.urlopen(request, timeout=timeout)
+        return body
 
-        response = self._request_with_retry(call)
+    def redirect_location(self, url, timeout, headers=None):
+        """Send a HEAD request to url and return its redirect target, or ""."""
+        response = self._request_with_retry(
+            lambda: self._open(url, timeout, "HEAD", headers)
+        )
         try:
-            response.read()
+            if 300 <= response.status < 400:
+                return response.headers.get("Location") or ""
+            return ""
         finally:
             response.close()
 
-    def _request_with_retry(self, call):
-        attempt = 0
-        while True:
+    def peek_bytes(self, url):
+        """Return the cached body for url, stale or not, without any request."""
+        entry = self.cache.get(url) if self.cache else None
+        return entry["body"] if entry else None
+
+    def _open(self, url, timeout, method, headers):
+        import urllib.request
+
+        request = urllib.request.Request(
+            url, method=method, headers=self._merge_headers(headers)
+        )
+        return self._opener.open(request, timeout=timeout)
+
+    def _request_with_retry(self, call, retryable_statuses=HTTP_RETRYABLE_STATUSES):
+        for attempt in range(self.retries):
             try:
                 return call()
-            except urllib.error.HTTPError as exc:
-                if exc.code < 500 or attempt >= self.retries - 1:
-                    raise
-                self._sleep(attempt)
-                attempt += 1
             except urllib.error.URLError as exc:
-                if attempt >= self.retries - 1:
+                # HTTPError is a URLError; only transient HTTP statuses are
+                # worth retrying, whereas connection-level errors always are.
+                retryable = (
+                    not isinstance(exc, urllib.error.HTTPError)
+                    or exc.code in retryable_statuses
+                )
+                if not retryable or attempt >= self.retries - 1:
                     raise
                 self._sleep(attempt)
-                attempt += 1
 
     def _sleep(self, attempt):
         if self.backoff <= 0:
             return
-        time.sleep(self.backoff * (attempt + 1))
+        # Exponential backoff with jitter so concurrent controllers don't
+        # retry against a struggling server in lockstep.
+        delay = self.backoff * (2**attempt) * random.uniform(0.5, 1.5)
+        time.sleep(min(delay, HTTP_RETRY_MAX_BACKOFF))
+
+    def _conditional_headers(self, custom, entry):
+        headers = dict(custom or {})
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
 
     def _merge_headers(self, custom):
+        # urllib.request.Request copies the headers it is given, so the shared
+        # defaults can be handed over as-is when there is nothing to add.
+        if not custom:
+            return DEFAULT_HEADERS
         headers = dict(DEFAULT_HEADERS)
-        if custom:
-            headers.update(custom)
+        headers.update(custom)
         return headers
 
 
-def _trim(value):
-    return (value or "").strip()
+def _fetch_json(http_client, url, timeout, headers=None):
+    try:
+        body = http_client.fetch_bytes(url, timeout, headers=headers)
+    except urllib.error.HTTPError as exc:
+        raise ResolutionError(f"HTTP {exc.code} retrieving {url}") from exc
+    except urllib.error.URLError as exc:
+        raise ResolutionError(f"Unable to retrieve JSON from {url}: {exc}") from exc
+    return _parse_json(body, url)
+
+
+def _parse_json(body, url):
+    # json.loads decodes UTF-8 bytes itself; a bad encoding surfaces as a
+    # UnicodeDecodeError, which is a ValueError like JSONDecodeError.
+    try:
+        payload = json.loads(body)
+    except ValueError as exc:
+        raise ResolutionError(f"Failed to parse JSON from {url}: {exc}") from exc
+    if not isinstance(payload, dict):
+        raise ResolutionError(f"Expected a JSON object from {url}.")
+    return payload
 
 
 class AIPscanResolver:
-    """Determine the AIPscan package version, falling back to PyPI metadata."""
+    """Determine the AIPscan package version, falling back to the PyPI index."""
 
     def __init__(self, http_client, timeout, explicit_value):
         self.http_client = http_client
         self.timeout = timeout
-        self.explicit_value = explicit_value or ""
+        self.explicit_value = (explicit_value or "").strip()
 
     def resolve(self):
-        trimmed = _trim(self.explicit_value)
-        if trimmed:
-            return trimmed
-
-        payload = self._fetch_json(PYPI_AIPSCAN_METADATA_URL)
-        version = _trim(payload.get("info", {}).get("version"))
+        if self.explicit_value:
+            return self.explicit_value
+
+        payload = _fetch_json(
+            self.http_client,
+            PYPI_AIPSCAN_INDEX_URL,
+            self.timeout,
+            headers=PYPI_SIMPLE_JSON_HEADERS,
+        )
+        version = self._latest_final_release(payload)
         if not version:
             raise ResolutionError(
-                "PyPI metadata for AIPscan did not include a version field."
+                "PyPI index for AIPscan did not include a released version."
             )
         return version
 
-    def _fetch_json(self, url):
-        try:
-            body = self.http_client.fetch_bytes(url, self.timeout).decode("utf-8")
-        except urllib.error.HTTPError as exc:
-            raise ResolutionError(f"HTTP {exc.code} retrieving {url}") from exc
-        except urllib.error.URLError as exc:
-            raise ResolutionError(f"Unable to retrieve JSON from {url}: {exc}") from exc
+    def peek(self):
+        """Best guess at the version without network access, or "" if unknown."""
+        if self.explicit_value:
+            return self.explicit_value
+
+        body = self.http_client.peek_bytes(PYPI_AIPSCAN_INDEX_URL)
+        if not body:
+            return ""
         try:
-            return json.loads(body)
-        except (ValueError, UnicodeDecodeError) as exc:
-            raise ResolutionError(f"Failed to parse JSON from {url}: {exc}") from exc
+            payload = _parse_json(body, PYPI_AIPSCAN_INDEX_URL)
+        except ResolutionError:
+            return ""
+        return self._latest_final_release(payload)
+
+    def _latest_final_release(self, payload):
+        # The index lists every published version, pre-releases and yanked
+        # releases included, so pick the highest final (or post) release that
+        # still has an installable file rather than trusting the order.
+        yanked = self._yanked_versions(payload.get("files") or [])
+        releases = {}
+        for version in payload.get("versions") or []:
+            if not isinstance(version, str) or version in yanked:
+                continue
+            match = _FINAL_RELEASE_RE.fullmatch(version)
+            if match:
+                releases[version] = (
+                    tuple(int(part) for part in match["release"].split(".")),
+                    int(match["post"] or -1),
+                )
+        if not releases:
+            return ""
+        return max(releases, key=releases.get)
+
+    def _yanked_versions(self, files):
+        available = set()
+        yanked = set()
+        for entry in files:
+            if not isinstance(entry, dict):
+                continue
+            match = _DIST_FILENAME_RE.fullmatch(entry.get("filename") or "")
+            if not match:
+                continue
+            if entry.get("yanked"):
+                yanked.add(match["version"])
+            else:
+                available.add(match["version"])
+        return yanked - available
 
 
 class UvResolver:
-    """Resolve the uv release tag by inspecting GitHub's latest-release redirect."""
+    """Resolve the uv release tag from GitHub's latest-release API.
+
+    When the API quota is exhausted, fall back to reading the redirect of the
+    latest-release page, which is not rate limited.
+    """
 
     def __init__(self, http_client, timeout, explicit_value):
         self.http_client = http_client
         self.timeout = timeout
-        self.explicit_value = explicit_value or ""
+        self.explicit_value = (explicit_value or "").strip()
 
     def resolve(self):
-        trimmed = _trim(self.explicit_value)
-        if trimmed:
-            return trimmed
+        if self.explicit_value:
+            return self.explicit_value
 
+        url = UV_LATEST_RELEASE_URL
         try:
-            self.http_client.head(
-                UV_LATEST_RELEASE_URL,
+            # A rate-limited API will not recover within the retry backoff, so
+            # go straight to the release page instead of spending more quota.
+            body = self.http_client.fetch_bytes(
+                url,
                 self.timeout,
-                opener=urllib.request.build_opener(NoRedirectHandler),
+                headers=self._api_headers(),
+                retryable_statuses=HTTP_RETRYABLE_STATUSES - GITHUB_RATE_LIMIT_STATUSES,
             )
         except urllib.error.HTTPError as exc:
-            if exc.code in (301, 302, 303, 307, 308):
-                location = exc.headers.get("Location")
-                if not location:
-                    raise ResolutionError(
-                        "GitHub redirected for the latest uv release but did not provide a Location header."
-                    )
-                version = self._extract_uv_version_from_location(location)
-                if not version:
-                    raise ResolutionError(
-                        "Failed to extract the uv release version from redirect Location header."
-                    )
-                return version
+            if exc.code in GITHUB_RATE_LIMIT_STATUSES:
+                return self._resolve_from_release_page()
+            raise ResolutionError(f"HTTP {exc.code} retrieving {url}") from exc
+        except urllib.error.URLError as exc:
+            raise ResolutionError(f"Unable to retrieve JSON from {url}: {exc}") from exc
+
+        payload = _parse_json(body, url)
+        version = self._extract_uv_version_from_tag(payload.get("tag_name"))
+        if not version:
             raise ResolutionError(
-                f"Unexpected response retrieving latest uv release: HTTP {exc.code}"
-            ) from exc
+                "GitHub release metadata for uv did not include a tag_name field."
+            )
+        return version
+
+    def _api_headers(self):
+        token = os.environ.get("GITHUB_TOKEN", "").strip()
+        if not token:
+            return GITHUB_API_HEADERS
+        return {**GITHUB_API_HEADERS, "Authorization": f"Bearer {token}"}
+
+    def _resolve_from_release_page(self):
+        url = UV_LATEST_RELEASE_PAGE_URL
+        try:
+            location = self.http_client.redirect_location(url, self.timeout)
+        except urllib.error.HTTPError as exc:
+            raise ResolutionError(f"HTTP {exc.code} retrieving {url}") from exc
         except urllib.error.URLError as exc:
             raise ResolutionError(
                 f"Unable to discover the latest uv release: {exc}"
             ) from exc
 
-        raise ResolutionError(
-            "Expected GitHub to redirect for the latest uv release, but the request completed without a redirect."
-        )
+        if not location:
+            raise ResolutionError(
+                "Expected GitHub to redirect for the latest uv release, but it did not."
+            )
+        match = _UV_RELEASE_PAGE_TAG_RE.search(location)
+        version = self._extract_uv_version_from_tag(match.group(1) if match else "")
+        if not version:
+            raise ResolutionError(
+                f"Failed to extract the uv release version from {location}."
+            )
+        return version
 
-    def _extract_uv_version_from_location(self, location):
-        match = re.search(r"/tag/([^/?#]+)", location)
+    def _extract_uv_version_from_tag(self, tag):
+        match = _UV_TAG_RE.search((tag or "").strip())
         if not match:
             return ""
-        tag = match.group(1)
-        return _trim(tag.split("?")[0])
+        return match.group(1)
 
 
 class PythonResolver:
@@ -197,44 +444,59 @@ class PythonResolver:
     def __init__(self, http_client, timeout, explicit_value):
         self.http_client = http_client
         self.timeout = timeout
-        self.explicit_value = explicit_value or ""
+        self.explicit_value = (explicit_value or "").strip()
 
     def resolve(self, aipscan_version):
-        trimmed = _trim(self.explicit_value)
-        if trimmed:
-            return trimmed
+        if self.explicit_value:
+            return self.explicit_value
         if not aipscan_version:
             raise ResolutionError(
                 "Cannot determine Python version because the AIPscan version is unset."
             )
 
         source_url = PYTHON_VERSION_TEMPLATE.format(tag=aipscan_version)
-        content = self._fetch_text(source_url)
-        version = _trim(content)
+        content = self._fetch_bytes(source_url).strip()
+        try:
+            version = content.decode("ascii")
+        except UnicodeDecodeError as exc:
+            raise ResolutionError(
+                f"The .python-version file for AIPscan {aipscan_version} is not plain ASCII."
+            ) from exc
         if not version:
             raise ResolutionError(
                 f"The .python-version file for AIPscan {aipscan_version} was empty or whitespace-only."
             )
         return version
 
-    def _fetch_text(self, url):
+    def _fetch_bytes(self, url):
         try:
-            return self.http_client.fetch_bytes(url, self.timeout).decode("utf-8")
+            return self.http_client.fetch_bytes(url, self.timeout)
         except urllib.error.HTTPError as exc:
             raise ResolutionError(f"HTTP {exc.code} retrieving {url}") from exc
         except urllib.error.URLError as exc:
             raise ResolutionError(f"Unable to retrieve text from {url}: {exc}") from exc
 
 
+@dataclass(frozen=True)
+class ResolveParams:
+    """Options for a single run, gathered from task args and host vars."""
+
+    timeout: int = DEFAULT_TIMEOUT
+    cache_ttl: int = CACHE_TTL
+    aipscan_version: str = ""
+    aipscan_uv_version: str = ""
+    aipscan_python_version: str = ""
+
+
 class ResolverFactory:
     """Create resolver instances for the action module."""
 
-    def build(self, http_client, timeout, params):
-        params = params or {}
+    def build(self, http_client, params):
+        timeout = params.timeout
         return (
-            AIPscanResolver(http_client, timeout, params.get("aipscan_version")),
-            UvResolver(http_client, timeout, params.get("aipscan_uv_version")),
-            PythonResolver(http_client, timeout, params.get("aipscan_python_version")),
+            AIPscanResolver(http_client, timeout, params.aipscan_version),
+            UvResolver(http_client, timeout, params.aipscan_uv_version),
+            PythonResolver(http_client, timeout, params.aipscan_python_version),
         )
 
 
@@ -264,18 +526,35 @@ class ActionModule(ActionBase):
     def run(self, tmp=None, task_vars=None):
         result = super().run(tmp, task_vars)
         params = self._gather_params(task_vars)
-        timeout = self._normalize_timeout(params.get("timeout"))
-        http_client = HttpClient()
+        cache = _DiskCache(ttl=params.cache_ttl) if params.cache_ttl else None
+        http_client = HttpClient(cache=cache)
 
         try:
             (
                 aipscan_resolver,
                 uv_resolver,
                 python_resolver,
-            ) = self._resolver_factory.build(http_client, timeout, params)
-            aipscan_version = aipscan_resolver.resolve()
-            uv_version = uv_resolver.resolve()
-            python_version = python_resolver.resolve(aipscan_version)
+            ) = self._resolver_factory.build(http_client, params)
+            # The AIPscan and uv lookups are independent network round trips,
+            # so run them side by side. The Python lookup depends on the
+            # AIPscan version, but that is usually known up front (pinned, or
+            # the last cached release), so start it speculatively and only
+            # redo it when PyPI reports something else.
+            guessed_aipscan_version = aipscan_resolver.peek()
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                aipscan_future = executor.submit(aipscan_resolver.resolve)
+                uv_future = executor.submit(uv_resolver.resolve)
+                python_future = None
+                if guessed_aipscan_version:
+                    python_future = executor.submit(
+                        python_resolver.resolve, guessed_aipscan_version
+                    )
+                aipscan_version = aipscan_future.result()
+                if python_future and aipscan_version == guessed_aipscan_version:
+                    python_version = python_future.result()
+                else:
+                    python_version = python_resolver.resolve(aipscan_version)
+                uv_version = uv_future.result()
         except ResolutionError as exc:
             result.update(failed=True, msg=str(exc))
             return result
@@ -291,18 +570,20 @@ class ActionModule(ActionBase):
         return result
 
     def _gather_params(self, task_vars):
-        params = {}
         context = task_vars or {}
-        for key in (
-            "timeout",
-            "aipscan_version",
-            "aipscan_uv_version",
-            "aipscan_python_version",
-        ):
-            if key in context:
-                params[key] = context[key]
-        params.update(self._task.args or {})
-        return params
+        args = self._task.args or {}
+
+        def lookup(key):
+            # Task arguments take precedence over variables of the same name.
+            return args[key] if key in args else context.get(key)
+
+        return ResolveParams(
+            timeout=self._normalize_timeout(lookup("timeout")),
+            cache_ttl=self._normalize_cache_ttl(lookup("cache_ttl")),
+            aipscan_version=lookup("aipscan_version") or "",
+            aipscan_uv_version=lookup("aipscan_uv_version") or "",
+            aipscan_python_version=lookup("aipscan_python_version") or "",
+        )
 
     def _normalize_timeout(self, value):
         try:
@@ -312,3 +593,12 @@ class ActionModule(ActionBase):
         if timeout <= 0:
             return DEFAULT_TIMEOUT
         return timeout
+
+    def _normalize_cache_ttl(self, value):
+        try:
+            ttl = int(value)
+        except (TypeError, ValueError):
+            return CACHE_TTL
+        if ttl < 0:
+            return CACHE_TTL
+        return ttl
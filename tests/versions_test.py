@@ -2,29 +2,49 @@
 """Interface-focused tests for the versions action plugin."""
 
 import json
+import random
+import time
 import urllib.error
 from unittest.mock import MagicMock
 
 import pytest
 
 from action_plugins.versions import (
+    CACHE_TTL,
+    DEFAULT_TIMEOUT,
     ActionModule,
     AIPscanResolver,
+    HttpClient,
     PythonResolver,
     ResolutionError,
+    ResolveParams,
     UvResolver,
+    _DiskCache,
+    _shared_opener,
 )
 
 
 class FakeHttpClient:
-    def __init__(self, fetch_responses=None, head_response=None):
+    def __init__(self, fetch_responses=None, peek_response=None, location=None):
         self.fetch_responses = list(fetch_responses or [])
-        self.head_response = head_response
+        self.peek_response = peek_response
+        self.location = location
         self.fetch_calls = []
-        self.head_calls = []
+        self.location_calls = []
 
-    def fetch_bytes(self, url, timeout, **kwargs):
-        self.fetch_calls.append((url, timeout))
+    def peek_bytes(self, url):
+        return self.peek_response
+
+    def redirect_location(self, url, timeout, **kwargs):
+        self.location_calls.append(url)
+        if self.location is None:
+            raise AssertionError("redirect_location called unexpectedly")
+        if isinstance(self.location, Exception):
+            raise self.location
+        return self.location
+
+    def fetch_bytes(self, url, timeout, headers=None, **kwargs):
+        self.fetch_calls.append((url, timeout, headers))
         if not self.fetch_responses:
             raise AssertionError("fetch_bytes called unexpectedly")
         value = self.fetch_responses.pop(0)
@@ -32,23 +52,50 @@ class FakeHttpClient:
             raise value
         return value
 
-    def head(self, url, timeout, **kwargs):
-        self.head_calls.append((url, timeout))
-        if isinstance(self.head_response, Exception):
-            raise self.head_response
-        return self.head_response
+
+class FakeResponse:
+    def __init__(self, body, headers=None, status=200):
+        self.body = body
+        self.headers = headers or {}
+        self.status = status
+
+    def read(self):
+        return self.body
+
+    def close(self):
+        pass
+
+
+class FakeOpener:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def open(self, request, timeout=None):
+        self.requests.append(request)
+        value = self.responses.pop(0)
+        if isinstance(value, Exception):
+            raise value
+        return value
 
 
 class FakeResolver:
-    def __init__(self, value=None, error=None):
+    def __init__(self, value=None, error=None, guess="", errors_by_arg=None):
         self.value = value
         self.error = error
+        self.guess = guess
+        self.errors_by_arg = errors_by_arg or {}
         self.calls = []
 
+    def peek(self):
+        return self.guess
+
     def resolve(self, *args):
         self.calls.append(args)
         if self.error:
             raise self.error
+        if args and args[0] in self.errors_by_arg:
+            raise self.errors_by_arg[args[0]]
         return self.value
 
 
@@ -60,12 +107,10 @@ class FakeResolverFactory:
             python_resolver,
         )
         self.http_client = None
-        self.timeout = None
         self.params = None
 
-    def build(self, http_client, timeout, params):
+    def build(self, http_client, params):
         self.http_client = http_client
-        self.timeout = timeout
         self.params = params
         return self._resolvers
 
@@ -105,7 +150,7 @@ def test_run_resolves_using_provided_resolvers():
     assert facts["aipscan_uv_version"] == "0.5.11"
     assert facts["aipscan_python_version"] == "3.11.9"
     assert python_resolver.calls[0][0] == "4.5.6"
-    assert factory.params == {}
+    assert factory.params == ResolveParams(timeout=DEFAULT_TIMEOUT)
 
 
 def test_run_uses_explicit_versions_from_params():
@@ -125,11 +170,104 @@ def test_run_uses_explicit_versions_from_params():
     assert facts["aipscan_version"] == "9.9.9"
     assert facts["aipscan_uv_version"] == "1.2.3"
     assert facts["aipscan_python_version"] == "3.12.1"
-    assert factory.params["aipscan_version"] == "9.9.9"
-    assert factory.params["aipscan_uv_version"] == "1.2.3"
+    assert factory.params.aipscan_version == "9.9.9"
+    assert factory.params.aipscan_uv_version == "1.2.3"
     assert python_resolver.calls[0][0] == "9.9.9"
 
 
+def test_run_prefers_task_args_over_task_vars():
+    factory = FakeResolverFactory(
+        FakeResolver("9.9.9"), FakeResolver("1.2.3"), FakeResolver("3.12.1")
+    )
+    module = _make_action_module(factory)
+    module._task.args = {"aipscan_version": "9.9.9", "timeout": "30"}
+
+    module.run(
+        task_vars={
+            "aipscan_version": "1.0.0",
+            "aipscan_uv_version": "0.5.0",
+            "timeout": 5,
+        }
+    )
+
+    assert factory.params == ResolveParams(
+        timeout=30, aipscan_version="9.9.9", aipscan_uv_version="0.5.0"
+    )
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(None, CACHE_TTL), ("120", 120), (-5, CACHE_TTL), ("x", CACHE_TTL)],
+)
+def test_run_normalizes_cache_ttl(value, expected):
+    factory = FakeResolverFactory(
+        FakeResolver("9.9.9"), FakeResolver("1.2.3"), FakeResolver("3.12.1")
+    )
+    module = _make_action_module(factory)
+    module._task.args = {"cache_ttl": value}
+
+    module.run(task_vars={})
+
+    assert factory.params.cache_ttl == expected
+    assert factory.http_client.cache.ttl == expected
+
+
+def test_run_disables_cache_when_ttl_is_zero():
+    factory = FakeResolverFactory(
+        FakeResolver("9.9.9"), FakeResolver("1.2.3"), FakeResolver("3.12.1")
+    )
+    module = _make_action_module(factory)
+    module._task.args = {"cache_ttl": "0"}
+
+    module.run(task_vars={})
+
+    assert factory.params.cache_ttl == 0
+    assert factory.http_client.cache is None
+
+
+def test_run_uses_speculative_python_version_when_guess_holds():
+    aipscan_resolver = FakeResolver("9.9.9", guess="9.9.9")
+    uv_resolver = FakeResolver("1.2.3")
+    python_resolver = FakeResolver("3.12.1")
+    factory = FakeResolverFactory(aipscan_resolver, uv_resolver, python_resolver)
+    module = _make_action_module(factory)
+
+    result = module.run(task_vars={})
+
+    assert result["ansible_facts"]["aipscan_python_version"] == "3.12.1"
+    assert python_resolver.calls == [("9.9.9",)]
+
+
+def test_run_refetches_python_version_when_guess_is_stale():
+    aipscan_resolver = FakeResolver("9.9.10", guess="9.9.9")
+    uv_resolver = FakeResolver("1.2.3")
+    python_resolver = FakeResolver("3.12.1")
+    factory = FakeResolverFactory(aipscan_resolver, uv_resolver, python_resolver)
+    module = _make_action_module(factory)
+
+    result = module.run(task_vars={})
+
+    assert result["ansible_facts"]["aipscan_version"] == "9.9.10"
+    assert sorted(python_resolver.calls) == [("9.9.10",), ("9.9.9",)]
+
+
+def test_run_discards_failed_speculative_python_lookup():
+    aipscan_resolver = FakeResolver("9.9.10", guess="9.9.9")
+    uv_resolver = FakeResolver("1.2.3")
+    python_resolver = FakeResolver(
+        "3.12.1", errors_by_arg={"9.9.9": ResolutionError("HTTP 404 retrieving")}
+    )
+    factory = FakeResolverFactory(aipscan_resolver, uv_resolver, python_resolver)
+    module = _make_action_module(factory)
+
+    result = module.run(task_vars={})
+
+    assert "failed" not in result
+    assert result["ansible_facts"]["aipscan_version"] == "9.9.10"
+    assert result["ansible_facts"]["aipscan_python_version"] == "3.12.1"
+    assert sorted(python_resolver.calls) == [("9.9.10",), ("9.9.9",)]
+
+
 def test_run_bubbles_up_resolution_errors():
     aipscan_resolver = FakeResolver("4.5.6")
     uv_resolver = FakeResolver("0.5.11")
@@ -145,6 +283,116 @@ def test_run_bubbles_up_resolution_errors():
     assert "Could not determine python version" in result["msg"]
 
 
+# ---------------------------------------------------------------------------
+# HTTP client tests
+# ---------------------------------------------------------------------------
+
+
+def test_http_client_serves_fresh_cache_entries(tmp_path):
+    cache = _DiskCache(directory=str(tmp_path))
+    client = HttpClient(backoff=0, cache=cache)
+    client._opener = FakeOpener([FakeResponse(b"payload", {"ETag": '"abc"'})])
+
+    assert client.fetch_bytes("https://example.org/x", 10) == b"payload"
+    assert client.fetch_bytes("https://example.org/x", 10) == b"payload"
+    assert len(client._opener.requests) == 1
+
+
+def test_http_client_revalidates_stale_cache_entries(tmp_path):
+    cache = _DiskCache(directory=str(tmp_path), ttl=0)
+    cache.put("https://example.org/x", b"payload", etag='"abc"')
+    not_modified = FakeResponse(b"", status=304)
+    client = HttpClient(backoff=0, cache=cache)
+    client._opener = FakeOpener([not_modified])
+
+    assert client.fetch_bytes("https://example.org/x", 10) == b"payload"
+    assert client._opener.requests[0].get_header("If-none-match") == '"abc"'
+
+
+def test_http_client_not_modified_refreshes_cache_entry(tmp_path, monkeypatch):
+    cache = _DiskCache(directory=str(tmp_path), ttl=60)
+    monkeypatch.setattr(time, "time", lambda: 0.0)
+    cache.put("https://example.org/x", b"payload", etag='"abc"')
+    monkeypatch.undo()
+    not_modified = FakeResponse(b"", {"ETag": '"def"'}, status=304)
+    client = HttpClient(backoff=0, cache=cache)
+    client._opener = FakeOpener([not_modified])
+
+    assert client.fetch_bytes("https://example.org/x", 10) == b"payload"
+    assert client.fetch_bytes("https://example.org/x", 10) == b"payload"
+    assert len(client._opener.requests) == 1
+    assert cache.get("https://example.org/x")["etag"] == '"def"'
+
+
+def test_shared_opener_returns_not_modified_responses():
+    response = FakeResponse(b"", status=304)
+
+    assert _shared_opener().error("http", None, response, 304, "", {}) is response
+
+
+def test_http_client_reads_redirect_location_of_head_requests():
+    redirect = FakeResponse(b"", {"Location": "https://example.org/y"}, status=302)
+    client = HttpClient(backoff=0)
+    client._opener = FakeOpener([redirect])
+
+    assert client.redirect_location("https://example.org/x", 10) == (
+        "https://example.org/y"
+    )
+    assert client._opener.requests[0].get_method() == "HEAD"
+
+
+def test_http_client_backoff_is_exponential_with_jitter(monkeypatch):
+    delays = []
+    monkeypatch.setattr(time, "sleep", delays.append)
+    monkeypatch.setattr(random, "uniform", lambda low, high: high)
+    client = HttpClient(backoff=0.5)
+
+    for attempt in range(3):
+        client._sleep(attempt)
+
+    assert delays == [0.75, 1.5, 3.0]
+
+
+def test_http_client_backoff_is_capped(monkeypatch):
+    delays = []
+    monkeypatch.setattr(time, "sleep", delays.append)
+    monkeypatch.setattr(random, "uniform", lambda low, high: 1.0)
+    client = HttpClient(backoff=4)
+
+    client._sleep(2)
+
+    assert delays == [5.0]
+
+
+def test_http_client_retries_server_errors():
+    unavailable = urllib.error.HTTPError("url", 503, "Unavailable", {}, None)
+    client = HttpClient(backoff=0)
+    client._opener = FakeOpener([unavailable, FakeResponse(b"payload")])
+
+    assert client.fetch_bytes("https://example.org/x", 10) == b"payload"
+    assert len(client._opener.requests) == 2
+
+
+def test_http_client_retries_rate_limiting():
+    too_many = urllib.error.HTTPError("url", 429, "Too Many Requests", {}, None)
+    client = HttpClient(backoff=0)
+    client._opener = FakeOpener([too_many, FakeResponse(b"payload")])
+
+    assert client.fetch_bytes("https://example.org/x", 10) == b"payload"
+    assert len(client._opener.requests) == 2
+
+
+@pytest.mark.parametrize("code", [404, 501])
+def test_http_client_does_not_retry_permanent_errors(code):
+    error = urllib.error.HTTPError("url", code, "Error", {}, None)
+    client = HttpClient(backoff=0)
+    client._opener = FakeOpener([error, FakeResponse(b"payload")])
+
+    with pytest.raises(urllib.error.HTTPError):
+        client.fetch_bytes("https://example.org/x", 10)
+    assert len(client._opener.requests) == 1
+
+
 # ---------------------------------------------------------------------------
 # Resolver unit tests
 # ---------------------------------------------------------------------------
@@ -157,20 +405,89 @@ def test_aipscan_resolver_returns_explicit_value():
 
 
 def test_aipscan_resolver_fetches_latest_version():
-    payload = json.dumps({"info": {"version": "4.5.6"}}).encode("utf-8")
+    payload = json.dumps({"versions": ["0.9.0", "0.10.0", "0.9.1"]}).encode("utf-8")
+    client = FakeHttpClient(fetch_responses=[payload])
+    resolver = AIPscanResolver(client, timeout=10, explicit_value="")
+
+    assert resolver.resolve() == "0.10.0"
+    url, _, headers = client.fetch_calls[0]
+    assert url == "https://pypi.org/simple/aipscan/"
+    assert headers["Accept"] == "application/vnd.pypi.simple.v1+json"
+
+
+def test_aipscan_resolver_skips_yanked_releases():
+    payload = json.dumps(
+        {
+            "versions": ["0.9.0", "0.10.0"],
+            "files": [
+                {"filename": "aipscan-0.9.0-py3-none-any.whl", "yanked": False},
+                {"filename": "aipscan-0.9.0.tar.gz", "yanked": False},
+                {"filename": "aipscan-0.10.0-py3-none-any.whl", "yanked": "Broken"},
+                {"filename": "aipscan-0.10.0.tar.gz", "yanked": True},
+            ],
+        }
+    ).encode("utf-8")
     client = FakeHttpClient(fetch_responses=[payload])
     resolver = AIPscanResolver(client, timeout=10, explicit_value="")
 
-    assert resolver.resolve() == "4.5.6"
-    assert client.fetch_calls[0][0] == "https://pypi.org/pypi/aipscan/json"
+    assert resolver.resolve() == "0.9.0"
+
+
+def test_aipscan_resolver_keeps_partially_yanked_releases():
+    payload = json.dumps(
+        {
+            "versions": ["0.9.0", "0.10.0"],
+            "files": [
+                {"filename": "aipscan-0.10.0-py3-none-any.whl", "yanked": True},
+                {"filename": "aipscan-0.10.0.tar.gz", "yanked": False},
+            ],
+        }
+    ).encode("utf-8")
+    client = FakeHttpClient(fetch_responses=[payload])
+    resolver = AIPscanResolver(client, timeout=10, explicit_value="")
+
+    assert resolver.resolve() == "0.10.0"
+
+
+def test_aipscan_resolver_accepts_post_releases():
+    payload = json.dumps(
+        {"versions": ["0.9.0", "0.9.0.post1", "0.9.0.post2rc1"]}
+    ).encode("utf-8")
+    client = FakeHttpClient(fetch_responses=[payload])
+    resolver = AIPscanResolver(client, timeout=10, explicit_value="")
+
+    assert resolver.resolve() == "0.9.0.post1"
+
+
+def test_aipscan_resolver_peeks_at_cached_index():
+    payload = json.dumps({"versions": ["0.9.0", "0.10.0"]}).encode("utf-8")
+    client = FakeHttpClient(peek_response=payload)
+    resolver = AIPscanResolver(client, timeout=10, explicit_value="")
+
+    assert resolver.peek() == "0.10.0"
+    assert client.fetch_calls == []
+
+
+def test_aipscan_resolver_peek_without_cache():
+    resolver = AIPscanResolver(FakeHttpClient(), timeout=10, explicit_value="")
+
+    assert resolver.peek() == ""
+
+
+def test_aipscan_resolver_skips_pre_releases():
+    payload = json.dumps({"versions": ["0.9.0", "0.10.0rc1"]}).encode("utf-8")
+    client = FakeHttpClient(fetch_responses=[payload])
+    resolver = AIPscanResolver(client, timeout=10, explicit_value="")
+
+    assert resolver.resolve() == "0.9.0"
 
 
 def test_aipscan_resolver_missing_version_raises():
-    payload = json.dumps({"info": {}}).encode("utf-8")
+    payload = json.dumps({"name": "aipscan"}).encode("utf-8")
     client = FakeHttpClient(fetch_responses=[payload])
     resolver = AIPscanResolver(client, timeout=10, explicit_value=None)
 
-    with pytest.raises(ResolutionError, match="did not include a version"):
+    with pytest.raises(ResolutionError, match="did not include a released version"):
         resolver.resolve()
 
 
@@ -191,60 +508,139 @@ def test_aipscan_resolver_invalid_json():
         resolver.resolve()
 
 
+def test_aipscan_resolver_rejects_non_object_json():
+    client = FakeHttpClient(fetch_responses=[b'["0.9.0"]'])
+    resolver = AIPscanResolver(client, timeout=10, explicit_value="")
+
+    with pytest.raises(ResolutionError, match="Expected a JSON object"):
+        resolver.resolve()
+
+
+def test_aipscan_resolver_peek_ignores_non_object_json():
+    client = FakeHttpClient(peek_response=b'"proxy error"')
+    resolver = AIPscanResolver(client, timeout=10, explicit_value="")
+
+    assert resolver.peek() == ""
+
+
 def test_uv_resolver_returns_explicit_value():
     resolver = UvResolver(FakeHttpClient(), timeout=10, explicit_value=" 0.5.4 ")
 
     assert resolver.resolve() == "0.5.4"
 
 
-def test_uv_resolver_reads_redirect_location():
-    location = "https://github.com/astral-sh/uv/releases/tag/0.5.11"
-    redirect = urllib.error.HTTPError(
-        "url",
-        302,
-        "Found",
-        {"Location": location},
-        None,
-    )
-    client = FakeHttpClient(head_response=redirect)
+def test_uv_resolver_reads_latest_release_tag():
+    payload = json.dumps({"tag_name": "0.5.11"}).encode("utf-8")
+    client = FakeHttpClient(fetch_responses=[payload])
+    resolver = UvResolver(client, timeout=10, explicit_value="")
+
+    assert resolver.resolve() == "0.5.11"
+    url, _, headers = client.fetch_calls[0]
+    assert url == "https://api.github.com/repos/astral-sh/uv/releases/latest"
+    assert headers["Accept"] == "application/vnd.github+json"
+
+
+def test_uv_resolver_strips_v_prefix():
+    payload = json.dumps({"tag_name": "v0.5.11"}).encode("utf-8")
+    client = FakeHttpClient(fetch_responses=[payload])
     resolver = UvResolver(client, timeout=10, explicit_value="")
 
     assert resolver.resolve() == "0.5.11"
-    assert client.head_calls[0][0] == "https://github.com/astral-sh/uv/releases/latest"
 
 
-def test_uv_resolver_missing_location_header():
-    redirect = urllib.error.HTTPError("url", 302, "Found", {}, None)
-    client = FakeHttpClient(head_response=redirect)
+def test_uv_resolver_missing_tag_name():
+    payload = json.dumps({"name": "0.5.11"}).encode("utf-8")
+    client = FakeHttpClient(fetch_responses=[payload])
+    resolver = UvResolver(client, timeout=10, explicit_value="")
+
+    with pytest.raises(ResolutionError, match="did not include a tag_name"):
+        resolver.resolve()
+
+
+def test_uv_resolver_rejects_non_object_json():
+    client = FakeHttpClient(fetch_responses=[b'"rate limited"'])
     resolver = UvResolver(client, timeout=10, explicit_value="")
 
-    with pytest.raises(ResolutionError, match="did not provide a Location"):
+    with pytest.raises(ResolutionError, match="Expected a JSON object"):
         resolver.resolve()
 
 
-def test_uv_resolver_unexpected_http_code():
+def test_uv_resolver_http_error():
     error = urllib.error.HTTPError("url", 404, "Not Found", {}, None)
-    client = FakeHttpClient(head_response=error)
+    client = FakeHttpClient(fetch_responses=[error])
     resolver = UvResolver(client, timeout=10, explicit_value="")
 
-    with pytest.raises(ResolutionError, match="Unexpected response"):
+    with pytest.raises(ResolutionError, match="HTTP 404"):
         resolver.resolve()
 
 
-def test_uv_resolver_url_error():
-    error = urllib.error.URLError("Timeout")
-    client = FakeHttpClient(head_response=error)
+def test_uv_resolver_sends_github_token(monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKEN", "secret")
+    payload = json.dumps({"tag_name": "0.5.11"}).encode("utf-8")
+    client = FakeHttpClient(fetch_responses=[payload])
+    resolver = UvResolver(client, timeout=10, explicit_value="")
+
+    assert resolver.resolve() == "0.5.11"
+    assert client.fetch_calls[0][2]["Authorization"] == "Bearer secret"
+
+
+@pytest.mark.parametrize("code", [403, 429])
+def test_uv_resolver_falls_back_to_release_page_when_rate_limited(code):
+    error = urllib.error.HTTPError(
+        "url", code, "Forbidden", {"X-RateLimit-Remaining": "0"}, None
+    )
+    location = "https://github.com/astral-sh/uv/releases/tag/0.5.11"
+    client = FakeHttpClient(fetch_responses=[error], location=location)
     resolver = UvResolver(client, timeout=10, explicit_value="")
 
-    with pytest.raises(ResolutionError, match="Unable to discover"):
+    assert resolver.resolve() == "0.5.11"
+    assert client.location_calls == [
+        "https://github.com/astral-sh/uv/releases/latest"
+    ]
+
+
+@pytest.mark.parametrize("code", [403, 429])
+def test_uv_resolver_does_not_retry_rate_limited_api(code):
+    error = urllib.error.HTTPError("url", code, "Rate limited", {}, None)
+    redirect = FakeResponse(
+        b"",
+        {"Location": "https://github.com/astral-sh/uv/releases/tag/0.5.11"},
+        status=302,
+    )
+    client = HttpClient(backoff=0)
+    client._opener = FakeOpener([error, redirect])
+    resolver = UvResolver(client, timeout=10, explicit_value="")
+
+    assert resolver.resolve() == "0.5.11"
+    methods = [request.get_method() for request in client._opener.requests]
+    assert methods == ["GET", "HEAD"]
+
+
+def test_uv_resolver_release_page_without_redirect():
+    error = urllib.error.HTTPError("url", 403, "Forbidden", {}, None)
+    client = FakeHttpClient(fetch_responses=[error], location="")
+    resolver = UvResolver(client, timeout=10, explicit_value="")
+
+    with pytest.raises(ResolutionError, match="did not"):
+        resolver.resolve()
+
+
+def test_uv_resolver_release_page_without_tag():
+    error = urllib.error.HTTPError("url", 403, "Forbidden", {}, None)
+    location = "https://github.com/astral-sh/uv/releases"
+    client = FakeHttpClient(fetch_responses=[error], location=location)
+    resolver = UvResolver(client, timeout=10, explicit_value="")
+
+    with pytest.raises(ResolutionError, match="Failed to extract the uv release"):
         resolver.resolve()
 
 
-def test_uv_resolver_without_redirect():
-    client = FakeHttpClient(head_response=None)
+def test_uv_resolver_url_error():
+    error = urllib.error.URLError("Timeout")
+    client = FakeHttpClient(fetch_responses=[error])
     resolver = UvResolver(client, timeout=10, explicit_value="")
 
-    with pytest.raises(ResolutionError, match="completed without a redirect"):
+    with pytest.raises(ResolutionError, match="Unable to retrieve JSON"):
         resolver.resolve()
 
 
@@ -277,6 +673,14 @@ def test_python_resolver_empty_file():
         resolver.resolve("1.2.3")
 
 
+def test_python_resolver_rejects_non_ascii_file():
+    client = FakeHttpClient(fetch_responses=[b"\xef\xbb\xbf3.11.9\n"])
+    resolver = PythonResolver(client, timeout=10, explicit_value="")
+
+    with pytest.raises(ResolutionError, match="not plain ASCII"):
+        resolver.resolve("1.2.3")
+
+
 def test_python_resolver_http_error():
     error = urllib.error.HTTPError("url", 404, "Not Found", {}, None)
     client = FakeHttpClient(fetch_responses=[error])